@@ -2,16 +2,21 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 
-from .const import CONF_API_KEY, CONF_STATION_ID, CONF_STATION_NAME, CONF_STATION_SERIES_LIST, DOMAIN
+from .const import (
+    CONF_API_KEY,
+    CONF_STATION_ID,
+    CONF_STATION_NAME,
+    CONF_STATION_SERIES_LIST,
+    DOMAIN,
+)
 from .nve_api import NVEAPI
-from .coordinator import SildreCoordinator
+from .coordinator import SildreCoordinator, SildreStationInfoCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,15 +45,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create coordinator for data updates
     coordinator = SildreCoordinator(
         hass=hass,
+        entry=entry,
         api=api,
         station_id=station_id,
         station_name=station_name,
         station_series_list=station_series_list,
     )
 
-    # Store coordinator and API client in hass data
+    # Fetch initial data so entities have state when the platform is set up.
+    # Raises ConfigEntryNotReady on failure, which makes Home Assistant retry.
+    await coordinator.async_config_entry_first_refresh()
+
+    # Create coordinator for the rarely changing culQ statistics
+    station_info_coordinator = SildreStationInfoCoordinator(
+        hass=hass,
+        entry=entry,
+        api=api,
+        station_id=station_id,
+    )
+    await station_info_coordinator.async_load()
+
+    # Store coordinators in hass data
     hass.data[DOMAIN][entry.entry_id] = {
         "coordinator": coordinator,
+        "station_info_coordinator": station_info_coordinator,
     }
 
     # Forward the setup to the sensor platform
@@ -62,7 +82,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        # Close API session and clean up coordinator
+        # Clean up coordinator
         if entry.entry_id in hass.data[DOMAIN]:
             hass.data[DOMAIN].pop(entry.entry_id)
 
@@ -7,11 +7,13 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.util import dt as dt_util
 
 from .const import (
     CONF_API_KEY,
+    CONF_STATION_CULQ_DATA,
+    CONF_STATION_CULQ_UPDATED,
     CONF_STATION_ID,
     CONF_STATION_NAME,
     CONF_STATION_SERIES_LIST,
@@ -33,6 +35,8 @@ class SildreFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.station_id: str | None = None
         self.station_name: str | None = None
         self.series_list: list[Any] | None = None
+        self.culq_data: dict[str, Any] | None = None
+        self._api: NVEAPI | None = None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -44,9 +48,10 @@ class SildreFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.api_key = user_input[CONF_API_KEY]
 
             try:
-                # Test the API key
+                # Test the API key and keep the client for the following steps
                 api = NVEAPI(self.api_key, self.hass)
                 await api.test_connection()
+                self._api = api
                 return await self.async_step_station()
             except InvalidAPIKey:
                 errors["base"] = "invalid_api_key"
@@ -80,8 +85,7 @@ class SildreFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 try:
                     # Validate station ID and get station name using the API
-                    api = NVEAPI(self.api_key, self.hass)
-                    station_info = await api.get_station_info(station_id)
+                    station_info = await self._api.get_station_info(station_id)
                     if not station_info:
                         errors["base"] = "invalid_station"
                     else:
@@ -89,6 +93,11 @@ class SildreFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         self.station_id = station_id
                         self.station_name = station_info.get("station_name")
                         self.series_list = station_info.get("series_list", [])
+                        # Hand the culQ values to the coordinator so it does not refetch them
+                        self.culq_data = {
+                            key: station_info.get(key)
+                            for key in ("culQm", "culQ5", "culQ50")
+                        }
 
                         _LOGGER.info("Validated station %s: %s with %d series",
                                      station_id, self.station_name, len(self.series_list))
@@ -101,6 +110,8 @@ class SildreFlowConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                                 CONF_STATION_ID: self.station_id,
                                 CONF_STATION_NAME: self.station_name,
                                 CONF_STATION_SERIES_LIST: self.series_list,
+                                CONF_STATION_CULQ_DATA: self.culq_data,
+                                CONF_STATION_CULQ_UPDATED: dt_util.utcnow().isoformat(),
                             },
                         )
                 except InvalidAPIKey:
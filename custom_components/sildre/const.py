@@ -9,13 +9,36 @@ CONF_STATION_ID = "station_id"
 CONF_STATION_NAME = "station_name"
 # List of dicts with 'parameter' and 'parameterName'
 CONF_STATION_SERIES_LIST = "station_series_list"
+# Dict with the 'culQm', 'culQ5' and 'culQ50' values, kept up to date
+CONF_STATION_CULQ_DATA = "station_culq_data"
+# ISO timestamp of when CONF_STATION_CULQ_DATA was fetched
+CONF_STATION_CULQ_UPDATED = "station_culq_updated"
 
 # API configuration
 NVE_API_BASE_URL = "https://hydapi.nve.no/api/v1"
+# Maximum number of concurrent requests to the NVE API across all entries
+MAX_CONCURRENT_REQUESTS = 4
+
+# hass.data key for the request semaphore shared by all API clients
+DATA_REQUEST_SEMAPHORE = f"{DOMAIN}_request_semaphore"
 
 # Update interval (30 minutes base with 30 seconds variance to prevent API collisions)
 UPDATE_INTERVAL_SECONDS = 600  # 10 minutes in seconds
 
+# Adaptive update interval: back off while no new observations arrive,
+# retry sooner after a failed update
+MIN_UPDATE_INTERVAL_SECONDS = 120  # 2 minutes in seconds
+MAX_UPDATE_INTERVAL_SECONDS = 3600  # 60 minutes in seconds
+UPDATE_INTERVAL_BACKOFF = 1.5
+STALE_POLLS_BEFORE_BACKOFF = 2
+
+# Measurement sensors stay available with their last value for this long
+# after the last successful update while polls fail
+UNAVAILABLE_GRACE_SECONDS = 3600  # 60 minutes in seconds
+
+# Station info (culQ statistics) is polled by its own, much slower coordinator
+STATION_INFO_UPDATE_INTERVAL_SECONDS = 604800  # 7 days in seconds
+
 # Sensor attributes
 ATTR_STATION_ID = "station_id"
 ATTR_STATION_NAME = "station_name"
@@ -23,6 +46,7 @@ ATTR_PARAMETER_NAME = "parameter_name"
 ATTR_PARAMETER_ID = "parameter_id"
 ATTR_VERSION_NO = "version_no"
 ATTR_UNIT = "unit"
+# Time of the last refresh that changed the observations, not of the last poll
 ATTR_LAST_UPDATE = "last_update"
 ATTR_OBSERVATION_TIME = "observation_time"
 
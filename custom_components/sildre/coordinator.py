@@ -2,29 +2,53 @@
 from __future__ import annotations
 
 import logging
-import random
+import zlib
 from datetime import datetime, timedelta
 from typing import Any, Dict, Optional
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    TimestampDataUpdateCoordinator,
+    UpdateFailed,
+)
+from homeassistant.util import dt as dt_util
 
 from .nve_api import NVEAPI
-from .const import UPDATE_INTERVAL_SECONDS
+from .const import (
+    CONF_STATION_CULQ_DATA,
+    CONF_STATION_CULQ_UPDATED,
+    MAX_UPDATE_INTERVAL_SECONDS,
+    MIN_UPDATE_INTERVAL_SECONDS,
+    STALE_POLLS_BEFORE_BACKOFF,
+    STATION_INFO_UPDATE_INTERVAL_SECONDS,
+    UPDATE_INTERVAL_BACKOFF,
+    UPDATE_INTERVAL_SECONDS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-# Base update interval with variance to prevent API collisions
+# Base update interval with a per-station offset to prevent API collisions
 BASE_UPDATE_INTERVAL = timedelta(seconds=UPDATE_INTERVAL_SECONDS)
 VARIANCE_SECONDS = 30
 
+# Bounds for the adaptive update interval
+MIN_UPDATE_INTERVAL = timedelta(seconds=MIN_UPDATE_INTERVAL_SECONDS)
+MAX_UPDATE_INTERVAL = timedelta(seconds=MAX_UPDATE_INTERVAL_SECONDS)
 
-class SildreCoordinator(DataUpdateCoordinator):
-    """Coordinator for Sildre data."""
+# Station metadata (culQ statistics) is effectively static
+STATION_INFO_UPDATE_INTERVAL = timedelta(
+    seconds=STATION_INFO_UPDATE_INTERVAL_SECONDS)
+
+
+class SildreCoordinator(TimestampDataUpdateCoordinator):
+    """Coordinator for Sildre observations."""
 
     def __init__(
         self,
         hass: HomeAssistant,
+        entry: ConfigEntry,
         api: NVEAPI,
         station_id: str,
         station_name: str,
@@ -32,11 +56,12 @@ class SildreCoordinator(DataUpdateCoordinator):
         update_interval: timedelta | None = None,
     ) -> None:
         """Initialize the coordinator."""
-        # Calculate update interval with random variance to prevent API collisions
+        # Offset the update interval by a stable, station derived amount so
+        # stations keep distinct slots across restarts
         if update_interval is None:
-            variance = timedelta(
-                seconds=random.randint(-VARIANCE_SECONDS, VARIANCE_SECONDS))
-            update_interval = BASE_UPDATE_INTERVAL + variance
+            offset = zlib.crc32(station_id.encode()) % (
+                2 * VARIANCE_SECONDS + 1) - VARIANCE_SECONDS
+            update_interval = BASE_UPDATE_INTERVAL + timedelta(seconds=offset)
 
         _LOGGER.debug(
             "Initializing coordinator for station %s with update interval: %s",
@@ -45,16 +70,24 @@ class SildreCoordinator(DataUpdateCoordinator):
 
         super().__init__(
             hass,
-            logging.getLogger(__name__),
+            _LOGGER,
+            config_entry=entry,
             name="sildre",
             update_interval=update_interval,
+            # Only notify sensors when the fetched data actually changed
+            always_update=False,
         )
         self.api = api
         self.station_id = station_id
         self.station_name = station_name
         self.station_series_list = station_series_list
+        # The series list is fixed for the lifetime of the config entry
+        self._parameter_ids_csv = ",".join(
+            str(series.get("parameter")) for series in station_series_list)
         self.station_data = {}
-        self._last_update: Optional[datetime] = None
+        self._base_update_interval = update_interval
+        self._last_observation_time: Optional[str] = None
+        self._unchanged_polls = 0
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data from NVE API for the station."""
@@ -62,73 +95,157 @@ class SildreCoordinator(DataUpdateCoordinator):
 
         try:
             station_data = await self._fetch_station_data()
-            if station_data:
-                data = station_data
-            else:
-                _LOGGER.warning(
-                    "No data received for station: %s", self.station_id)
-                data = {}
-
+        except UpdateFailed:
+            self._shorten_update_interval()
+            raise
         except Exception as err:
-            _LOGGER.error(
-                "Error updating data for station %s: %s", self.station_id, err
-            )
-            data = {}
+            self._shorten_update_interval()
+            raise UpdateFailed(
+                f"Error updating data for station {self.station_id}: {err}"
+            ) from err
 
-        self._last_update = datetime.now()
+        self._adapt_update_interval(station_data)
         _LOGGER.debug("Data update completed for station: %s", self.station_id)
         self.station_data = station_data
-        return data
+        return station_data
 
-    async def _fetch_station_data(self) -> Optional[Dict[str, Any]]:
-        """Fetch all data for the station."""
+    async def _fetch_station_data(self) -> Dict[str, Any]:
+        """Fetch the latest observations for the station."""
         station_data = {
             "station_id": self.station_id,
             "station_name": self.station_name,
-            "last_update": datetime.now().isoformat(),
         }
 
         # Fetch sildre data
-        parameter_ids = [str(series.get("parameter"))
-                         for series in self.station_series_list]
-        series_data = await self.api.get_series_data(self.station_id, parameter_ids)
-        if series_data:
-            station_data["series_data"] = series_data
-
-        # Fetch station info (includes culQ data)
-        station_info = await self.api.get_station_info(self.station_id)
-        if station_info:
-            # Extract culQ values from station info
-            culq_data = {}
-            if "culQm" in station_info:
-                culq_data["culQm"] = station_info["culQm"]
-            if "culQ5" in station_info:
-                culq_data["culQ5"] = station_info["culQ5"]
-            if "culQ50" in station_info:
-                culq_data["culQ50"] = station_info["culQ50"]
-
-            if culq_data:
-                station_data["culq_data"] = culq_data
-
-        # Only return data if we have at least some information
-        if len(station_data) > 2:  # More than just station_id and last_update
-            return station_data
-
-        return None
+        series_data = await self.api.get_series_data(
+            self.station_id, self._parameter_ids_csv)
+
+        # Failing here keeps the previous data on the coordinator
+        if series_data is None:
+            raise UpdateFailed(
+                f"Failed to fetch series data for station {self.station_id}")
+
+        # Keyed by parameter id so sensors can look up their series directly.
+        # May be empty for a station without observations, which is not an
+        # error, its sensors are just unknown
+        station_data["series_data"] = series_data
+        return station_data
+
+    def _shorten_update_interval(self) -> None:
+        """Retry sooner after a failed update."""
+        self.update_interval = max(self.update_interval / 2, MIN_UPDATE_INTERVAL)
+
+    def _adapt_update_interval(self, station_data: Dict[str, Any]) -> None:
+        """Back off while the station reports no new observations."""
+        latest_time = max(
+            (serie.get("time") or "" for serie in station_data.get("series_data", {}).values()),
+            default=None,
+        )
+        interval = max(self.update_interval, self._base_update_interval)
+
+        if latest_time and latest_time != self._last_observation_time:
+            self._last_observation_time = latest_time
+            self._unchanged_polls = 0
+            interval = self._base_update_interval
+        else:
+            self._unchanged_polls += 1
+            if self._unchanged_polls >= STALE_POLLS_BEFORE_BACKOFF:
+                interval = min(interval * UPDATE_INTERVAL_BACKOFF,
+                               MAX_UPDATE_INTERVAL)
+
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "Changing update interval for station %s to %s", self.station_id, interval
+            )
+        # The coordinator schedules the next refresh from update_interval
+        # after _async_update_data returns
+        self.update_interval = interval
 
     def get_data_for_parameter(self, parameter_id: str) -> Any:
         """Get data for a specific parameter."""
         if not self.station_data:
             return None
 
-        series_data = self.station_data.get("series_data", [])
-        for serie in series_data:
-            if str(serie.get("parameter")) == parameter_id:
-                return serie
-
-        return None
+        return self.station_data.get("series_data", {}).get(parameter_id)
 
     @property
     def last_update(self) -> Optional[datetime]:
-        """Return the last update time."""
-        return self._last_update
+        """Return the time of the last successful update."""
+        # Tracked by the coordinator outside of data, so it does not defeat
+        # the always_update=False equality check
+        return self.last_update_success_time
+
+
+class SildreStationInfoCoordinator(DataUpdateCoordinator):
+    """Coordinator for Sildre station info (culQ flood statistics)."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: NVEAPI,
+        station_id: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name="sildre_station_info",
+            update_interval=STATION_INFO_UPDATE_INTERVAL,
+            always_update=False,
+        )
+        self.api = api
+        self.station_id = station_id
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        """Update culQ data from NVE API for the station."""
+        _LOGGER.debug("Updating station info for station: %s", self.station_id)
+
+        try:
+            station_info = await self.api.get_station_info(self.station_id)
+        except Exception as err:
+            # Retry at the observation interval instead of waiting days
+            self.update_interval = BASE_UPDATE_INTERVAL
+            raise UpdateFailed(
+                f"Error updating station info for station {self.station_id}: {err}"
+            ) from err
+
+        if not station_info:
+            self.update_interval = BASE_UPDATE_INTERVAL
+            raise UpdateFailed(
+                f"No station info received for station {self.station_id}")
+
+        self.update_interval = STATION_INFO_UPDATE_INTERVAL
+        culq_data = {key: station_info.get(key)
+                     for key in ("culQm", "culQ5", "culQ50")}
+
+        # Persist the values so the next Home Assistant start can reuse them
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={
+                **self.config_entry.data,
+                CONF_STATION_CULQ_DATA: culq_data,
+                CONF_STATION_CULQ_UPDATED: dt_util.utcnow().isoformat(),
+            },
+        )
+        return culq_data
+
+    async def async_load(self) -> None:
+        """Load culQ data persisted in the config entry, refresh it if stale."""
+        culq_data = self.config_entry.data.get(CONF_STATION_CULQ_DATA)
+        updated = dt_util.parse_datetime(
+            self.config_entry.data.get(CONF_STATION_CULQ_UPDATED) or "")
+
+        age = dt_util.utcnow() - updated if updated else None
+        if culq_data and age is not None and timedelta() <= age < STATION_INFO_UPDATE_INTERVAL:
+            _LOGGER.debug(
+                "Using stored station info for station %s from %s", self.station_id, updated)
+            # Refresh when the stored values expire rather than a full interval
+            # from now, _async_update_data restores the regular interval
+            self.update_interval = STATION_INFO_UPDATE_INTERVAL - age
+            self.async_set_updated_data(culq_data)
+            return
+
+        # culQ data is optional, a failure here must not block setup
+        await self.async_refresh()
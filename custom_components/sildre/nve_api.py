@@ -1,85 +1,93 @@
 """NVE Hydrological API client."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import sys
 from typing import Any, Dict, Optional
 
 import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
 
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
-from .const import NVE_API_BASE_URL, VERSION
+from .const import (
+    DATA_REQUEST_SEMAPHORE,
+    MAX_CONCURRENT_REQUESTS,
+    NVE_API_BASE_URL,
+    VERSION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_URL_PARAMETERS = f"{NVE_API_BASE_URL}/Parameters"
+_URL_OBSERVATIONS = f"{NVE_API_BASE_URL}/Observations"
+_URL_STATIONS = f"{NVE_API_BASE_URL}/Stations"
+
+# Bound every request so a stalled endpoint cannot pin a coordinator update
+_TIMEOUT = aiohttp.ClientTimeout(total=20, connect=5)
+
 
 class NVEAPI:
     """NVE Hydrological API client."""
 
-    def __init__(self, api_key: str, hass) -> None:
+    def __init__(self, api_key: str, hass: HomeAssistant) -> None:
         """Initialize the NVE API client."""
         self.api_key = api_key
         self.hass = hass
-        self.session: Optional[aiohttp.ClientSession] = None
-        # Create headers once during initialization
-        self.headers = {"X-API-Key": self.api_key,
-                        "User-Agent": f"home-assistant-sildre/{VERSION} https://github.com/toringer/home-assistant-sildre"}
-
-    async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
-        _LOGGER.debug("Getting aiohttp session for NVE API")
-        if self.session is None or self.session.closed:
-            # Use Home Assistant's managed session
-            _LOGGER.debug("Creating new aiohttp session for NVE API")
-            self.session = async_get_clientsession(self.hass)
-        return self.session
-
-    async def close(self) -> None:
-        """Close the aiohttp session."""
-        # Home Assistant manages the session lifecycle, so we don't close it
-        self.session = None
+        # Home Assistant's shared session owns the connection pool and its lifecycle
+        self._session = async_get_clientsession(hass)
+        # Shared by all clients so many configured stations cannot flood the API
+        if DATA_REQUEST_SEMAPHORE not in hass.data:
+            hass.data[DATA_REQUEST_SEMAPHORE] = asyncio.Semaphore(
+                MAX_CONCURRENT_REQUESTS)
+        self._semaphore: asyncio.Semaphore = hass.data[DATA_REQUEST_SEMAPHORE]
+        # Create headers once during initialization, as a read-only
+        # CIMultiDictProxy so aiohttp does not convert them on every request
+        self.headers = CIMultiDictProxy(CIMultiDict({"X-API-Key": self.api_key,
+                                                     "User-Agent": f"home-assistant-sildre/{VERSION} https://github.com/toringer/home-assistant-sildre"}))
 
     async def test_connection(self) -> bool:
         """Test the API connection and key validity."""
         _LOGGER.debug("Testing NVE API connection with")
         try:
-            session = await self._get_session()
-
-            async with session.get(f"{NVE_API_BASE_URL}/Parameters", headers=self.headers) as response:
-                if response.status == 200:
-                    return True
-                elif response.status == 401:
-                    raise InvalidAPIKey("Invalid API key")
-                else:
-                    raise CannotConnect(
-                        f"API returned status {response.status}")
-        except aiohttp.ClientError as err:
-            raise CannotConnect(f"Failed to connect to NVE API: {err}")
+            async with self._semaphore, self._session.get(_URL_PARAMETERS, headers=self.headers, timeout=_TIMEOUT, raise_for_status=True):
+                return True
+        except aiohttp.ClientResponseError as err:
+            if err.status == 401:
+                raise InvalidAPIKey("Invalid API key") from err
+            raise CannotConnect(f"API returned status {err.status}") from err
+        except (aiohttp.ClientError, TimeoutError) as err:
+            raise CannotConnect(f"Failed to connect to NVE API: {err}") from err
 
     async def get_series_data(
-        self, station_id: str, parameters: list[str], resolution_time: int = 0
-    ) -> Optional[Dict[str, Any]]:
-        """Get data for a specific station."""
+        self,
+        station_id: str,
+        parameters: str,
+        resolution_time: int = 0,
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Get data for a specific station.
+
+        parameters is a comma separated list of parameter ids. The latest
+        observation of each parameter is returned, keyed by parameter id.
+        """
+        if not parameters:
+            return {}
+
         _LOGGER.debug("Fetching data for station %s", station_id)
         try:
-            session = await self._get_session()
             params = {
                 "StationId": station_id,
-                "Parameter": ",".join(parameters),
+                "Parameter": parameters,
                 "ResolutionTime": resolution_time,
             }
 
-            async with session.get(f"{NVE_API_BASE_URL}/Observations", params=params, headers=self.headers) as response:
-                if response.status != 200:
-                    _LOGGER.error(
-                        "Failed to fetch data for station %s: %s",
-                        station_id, response.status
-                    )
-                    return None
-
-                data = await response.json()
+            async with self._semaphore, self._session.get(_URL_OBSERVATIONS, params=params, headers=self.headers, timeout=_TIMEOUT, raise_for_status=True) as response:
+                data = await response.json(loads=json_loads)
                 series_data = data.get("data", [])
-                retval = []
+                retval = {}
                 for series in series_data:
                     observations = series.get("observations", [])
                     if not observations:
@@ -87,14 +95,15 @@ class NVEAPI:
                             "No observations found for parameter %s for station: %s", series.get("parameter"), station_id)
                         continue
 
-                    retval.append({
+                    # Interned so sensor lookups hit the identity fast path
+                    retval[sys.intern(str(series.get("parameter")))] = {
                         "parameter": series.get("parameter"),
                         "time": observations[-1].get("time"),
                         "value": observations[-1].get("value"),
                         "correction": observations[-1].get("correction"),
                         "quality": observations[-1].get("quality")
-                    })
-                return retval
+                    }
+            return retval
 
         except Exception as err:
             _LOGGER.error(
@@ -106,20 +115,10 @@ class NVEAPI:
         """Get detailed information about a station."""
         _LOGGER.debug("Fetching station info for station %s", station_id)
         try:
-            session = await self._get_session()
             params = {"StationId": station_id}
 
-            async with session.get(f"{NVE_API_BASE_URL}/Stations", params=params, headers=self.headers) as response:
-                if response.status == 401:
-                    raise InvalidAPIKey("Invalid API key")
-                elif response.status != 200:
-                    _LOGGER.error(
-                        "Failed to fetch station info for %s: %s",
-                        station_id, response.status
-                    )
-                    return None
-
-                data = await response.json()
+            async with self._semaphore, self._session.get(_URL_STATIONS, params=params, headers=self.headers, timeout=_TIMEOUT, raise_for_status=True) as response:
+                data = await response.json(loads=json_loads)
                 stations = data.get("data", [])
                 if not stations:
                     return None
@@ -145,9 +144,12 @@ class NVEAPI:
                 }
                 return retval
 
-        except InvalidAPIKey:
-            # Re-raise InvalidAPIKey exceptions
-            raise
+        except aiohttp.ClientResponseError as err:
+            if err.status == 401:
+                raise InvalidAPIKey("Invalid API key") from err
+            _LOGGER.error(
+                "Failed to fetch station info for %s: %s", station_id, err.status)
+            return None
         except Exception as err:
             _LOGGER.error(
                 "Error fetching station info for %s: %s", station_id, err)
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+import sys
+from abc import abstractmethod
+from datetime import datetime, timedelta
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -11,20 +13,20 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    ATTR_ATTRIBUTION,
     UnitOfVolumeFlowRate,
     UnitOfTemperature,
     UnitOfLength,
     UnitOfElectricPotential,
     UnitOfSpeed,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity
 )
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.util import dt as dt_util
 
 from .const import (
     ATTR_LAST_UPDATE,
@@ -38,12 +40,32 @@ from .const import (
     DOMAIN,
     SENSOR_CUL_QM,
     SENSOR_CUL_Q5,
-    SENSOR_CUL_Q50
+    SENSOR_CUL_Q50,
+    UNAVAILABLE_GRACE_SECONDS,
 )
-from .coordinator import SildreCoordinator
+from .coordinator import SildreCoordinator, SildreStationInfoCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Name suffix and station info key for each culQ sensor type
+_CULQ_META = {
+    SENSOR_CUL_QM: ("Mean Flooding (culQm)", "culQm"),
+    SENSOR_CUL_Q5: ("5-Year Flood Return Period (culQ5)", "culQ5"),
+    SENSOR_CUL_Q50: ("50-Year Flood Return Period (culQ50)", "culQ50"),
+}
+
+_UNAVAILABLE_GRACE = timedelta(seconds=UNAVAILABLE_GRACE_SECONDS)
+
+# Device class and unit for each unit reported by NVE
+_UNIT_MAP: dict[str, tuple[SensorDeviceClass, str]] = {
+    "m³/s": (SensorDeviceClass.VOLUME_FLOW_RATE, UnitOfVolumeFlowRate.CUBIC_METERS_PER_SECOND),
+    "°C": (SensorDeviceClass.TEMPERATURE, UnitOfTemperature.CELSIUS),
+    "m": (SensorDeviceClass.DISTANCE, UnitOfLength.METERS),
+    "Volt": (SensorDeviceClass.VOLTAGE, UnitOfElectricPotential.VOLT),
+    "m/s": (SensorDeviceClass.SPEED, UnitOfSpeed.METERS_PER_SECOND),
+    "mm": (SensorDeviceClass.PRECIPITATION, UnitOfLength.MILLIMETERS),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -53,64 +75,41 @@ async def async_setup_entry(
     """Set up the Sildre sensor platform."""
     domain_data = hass.data[DOMAIN][config_entry.entry_id]
     coordinator: SildreCoordinator = domain_data["coordinator"]
+    station_info_coordinator: SildreStationInfoCoordinator = domain_data[
+        "station_info_coordinator"]
 
     # Get station info from coordinator
     station_id = coordinator.station_id
     station_name = coordinator.station_name
     station_series_list = coordinator.station_series_list
     # Create sensors for the station
-    entities = []
-
-    for parameter in station_series_list:
-        parameter_id = str(parameter.get("parameter"))
-        parameter_name = parameter.get("parameter_name")
-        unit = parameter.get("unit")
-        version_no = parameter.get("version_no")
-
-        entities.append(
-            SildreMeasurementSensor(
-                coordinator,
-                station_id,
-                station_name,
-                parameter_name,
-                unit,
-                "mdi:water",
-                SensorDeviceClass.VOLUME_FLOW_RATE,
-                SensorStateClass.MEASUREMENT,
-                parameter_id,
-                version_no
-            )
-        )
-
-    # Create culQ sensors (these are from station info, not parameters)
-    entities.append(
-        SildreCulQSensor(
+    entities: list[SildreBaseSensor] = [
+        SildreMeasurementSensor(
             coordinator,
             station_id,
             station_name,
-            SENSOR_CUL_QM,
+            parameter.get("parameter_name"),
+            parameter.get("unit"),
+            "mdi:water",
+            SensorStateClass.MEASUREMENT,
+            sys.intern(str(parameter.get("parameter"))),
+            parameter.get("version_no"),
         )
-    )
+        for parameter in station_series_list
+    ]
 
-    entities.append(
+    # Create culQ sensors (these are from the station info coordinator, not parameters)
+    entities.extend(
         SildreCulQSensor(
-            coordinator,
+            station_info_coordinator,
             station_id,
             station_name,
-            SENSOR_CUL_Q5,
+            culq_type,
         )
+        for culq_type in _CULQ_META
     )
 
-    entities.append(
-        SildreCulQSensor(
-            coordinator,
-            station_id,
-            station_name,
-            SENSOR_CUL_Q50,
-        )
-    )
-
-    async_add_entities(entities, update_before_add=True)
+    async_add_entities(entities)
 
     # The coordinator is already started in the main init
     _LOGGER.info(
@@ -120,9 +119,12 @@ async def async_setup_entry(
 class SildreBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Sildre sensors."""
 
+    # Same for all sensors, Home Assistant adds it to the attributes
+    _attr_attribution = "Data provided by NVE Hydrological API"
+
     def __init__(
         self,
-        coordinator: SildreCoordinator,
+        coordinator: SildreCoordinator | SildreStationInfoCoordinator,
         station_id: str,
         station_name: str,
     ) -> None:
@@ -131,18 +133,13 @@ class SildreBaseSensor(CoordinatorEntity, SensorEntity):
         self.station_id = station_id
         self.station_name = station_name
 
-        # Set attribution for all sensors
-        self._attr_attribution = "Data provided by NVE Hydrological API"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.station_id)},
-            name=self.station_name,
+        # Device information never changes for a station
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, station_id)},
+            name=station_name,
             manufacturer="Norwegian Water Resources and Energy Directorate",
             model="Hydrological Monitoring Station",
-            configuration_url=f"https://sildre.nve.no/station/{self.station_id}",
+            configuration_url=f"https://sildre.nve.no/station/{station_id}",
         )
 
     @property
@@ -152,6 +149,16 @@ class SildreBaseSensor(CoordinatorEntity, SensorEntity):
             super().available and self.coordinator.data is not None
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_coordinator()
+        super()._handle_coordinator_update()
+
+    @abstractmethod
+    def _update_from_coordinator(self) -> None:
+        """Set state and attributes from the latest coordinator data."""
+
 
 class SildreMeasurementSensor(SildreBaseSensor):
     """Representation of an NVE measurement sensor."""
@@ -164,18 +171,12 @@ class SildreMeasurementSensor(SildreBaseSensor):
         sensor_name: str,
         unit: str,
         icon: str,
-        device_class: SensorDeviceClass | None = None,
         state_class: SensorStateClass = SensorStateClass.MEASUREMENT,
         parameter_id: str | None = None,
         version_no: str | None = None,
     ) -> None:
         """Initialize the measurement sensor."""
         super().__init__(coordinator, station_id, station_name)
-        self.sensor_name = sensor_name
-        self.unit = unit
-        self.icon = icon
-        self.device_class = device_class
-        self.state_class = state_class
         self.parameter_id = parameter_id
         self.version_no = version_no
 
@@ -185,72 +186,97 @@ class SildreMeasurementSensor(SildreBaseSensor):
         # Set name
         self._attr_name = f"{station_name} {sensor_name}"
 
-        # Set device class and state class
-        if self.unit == "m³/s":
-            self._attr_device_class = SensorDeviceClass.VOLUME_FLOW_RATE
-            self._attr_native_unit_of_measurement = UnitOfVolumeFlowRate.CUBIC_METERS_PER_SECOND
-        elif self.unit == "°C":
-            self._attr_device_class = SensorDeviceClass.TEMPERATURE
-            self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-        elif self.unit == "m":
-            self._attr_device_class = SensorDeviceClass.DISTANCE
-            self._attr_native_unit_of_measurement = UnitOfLength.METERS
-        elif self.unit == "Volt":
-            self._attr_device_class = SensorDeviceClass.VOLTAGE
-            self._attr_native_unit_of_measurement = UnitOfElectricPotential.VOLT
-        elif self.unit == "m/s":
-            self._attr_device_class = SensorDeviceClass.SPEED
-            self._attr_native_unit_of_measurement = UnitOfSpeed.METERS_PER_SECOND
-        elif self.unit == "mm":
-            self._attr_device_class = SensorDeviceClass.PRECIPITATION
-            self._attr_native_unit_of_measurement = UnitOfLength.MILLIMETERS
-        else:
-            self._attr_device_class = SensorDeviceClass.GENERIC
-            self._attr_native_unit_of_measurement = self.unit
+        # Set device class and state class, units NVE reports that Home
+        # Assistant has no device class for are passed through as is
+        self._attr_device_class, self._attr_native_unit_of_measurement = _UNIT_MAP.get(
+            unit, (None, unit))
 
         self._attr_state_class = state_class
 
         self._attr_icon = icon
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            _LOGGER.debug("No coordinator data for sensor %s",
-                          self._attr_unique_id)
-            return None
-
-        parameter = self.coordinator.get_data_for_parameter(self.parameter_id)
-        if not parameter:
-            _LOGGER.debug("No parameter data found for parameter %s for sensor %s",
-                          self.parameter_id, self._attr_unique_id)
-            return None
-
-        latest_value = parameter.get("value")
-        _LOGGER.debug("Sensor %s found value: %s",
-                      self._attr_unique_id, latest_value)
-        return latest_value
+        # Attributes that never change, merged with per-update values
+        self._static_attrs = {
+            ATTR_PARAMETER_ID: parameter_id,
+            ATTR_PARAMETER_NAME: sensor_name,
+            ATTR_STATION_ID: station_id,
+            ATTR_STATION_NAME: station_name,
+            ATTR_UNIT: unit,
+            ATTR_VERSION_NO: version_no,
+        }
+        self._unsub_grace_expired: CALLBACK_TYPE | None = None
+
+        self._update_from_coordinator()
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        if not self.coordinator.data:
-            return {}
+    def available(self) -> bool:
+        """Return True if entity is available.
+
+        Failed polls keep the previous coordinator data, so the sensor keeps
+        serving it for _UNAVAILABLE_GRACE after the last successful update.
+        """
+        if super().available:
+            return True
 
-        parameter = self.coordinator.get_data_for_parameter(self.parameter_id)
+        last_success = self.coordinator.last_update_success_time
+        return (
+            self.coordinator.data is not None
+            and last_success is not None
+            and dt_util.utcnow() - last_success < _UNAVAILABLE_GRACE
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._cancel_grace_expired()
+        # The coordinator does not notify again on repeated failures, so
+        # write the state once more when the grace period runs out
+        last_success = self.coordinator.last_update_success_time
+        if not self.coordinator.last_update_success and last_success:
+            self._unsub_grace_expired = async_call_later(
+                self.hass,
+                last_success + _UNAVAILABLE_GRACE - dt_util.utcnow(),
+                self._async_grace_expired,
+            )
+        super()._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending grace period check."""
+        self._cancel_grace_expired()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _async_grace_expired(self, _now: datetime) -> None:
+        """Mark the sensor unavailable once the grace period has run out."""
+        self._unsub_grace_expired = None
+        self.async_write_ha_state()
+
+    def _cancel_grace_expired(self) -> None:
+        """Cancel the pending grace period check, if any."""
+        if self._unsub_grace_expired:
+            self._unsub_grace_expired()
+            self._unsub_grace_expired = None
+
+    def _update_from_coordinator(self) -> None:
+        """Set state and attributes from the latest coordinator data."""
         station_data = self.coordinator.data
-        attrs = {
-            ATTR_ATTRIBUTION: "Data provided by NVE Hydrological API",
-            ATTR_LAST_UPDATE: station_data.get("last_update"),
+        if not station_data:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+            return
+
+        # The API client already logs parameters without observations
+        parameter = self.coordinator.get_data_for_parameter(self.parameter_id) or {}
+
+        # Only runs when the observations changed (always_update=False), so
+        # last_update is the time of the last refresh that brought new data
+        last_update = self.coordinator.last_update
+        self._attr_native_value = parameter.get("value")
+        self._attr_extra_state_attributes = {
+            **self._static_attrs,
+            ATTR_LAST_UPDATE: last_update.isoformat() if last_update else None,
             ATTR_OBSERVATION_TIME: parameter.get("time"),
-            ATTR_PARAMETER_ID: self.parameter_id,
-            ATTR_PARAMETER_NAME: self.sensor_name,
-            ATTR_STATION_ID: station_data.get("station_id"),
-            ATTR_STATION_NAME: station_data.get("station_name"),
-            ATTR_UNIT: self.unit,
-            ATTR_VERSION_NO: self.version_no,
         }
-        return attrs
 
 
 class SildreCulQSensor(SildreBaseSensor):
@@ -258,7 +284,7 @@ class SildreCulQSensor(SildreBaseSensor):
 
     def __init__(
         self,
-        coordinator: SildreCoordinator,
+        coordinator: SildreStationInfoCoordinator,
         station_id: str,
         station_name: str,
         culq_type: str,
@@ -270,15 +296,9 @@ class SildreCulQSensor(SildreBaseSensor):
         # Set unique ID based on culQ type
         self._attr_unique_id = f"{station_id}_{culq_type}"
 
-        # Set name based on culQ type
-        if culq_type == SENSOR_CUL_QM:
-            self._attr_name = f"{station_name} Mean Flooding (culQm)"
-        elif culq_type == SENSOR_CUL_Q5:
-            self._attr_name = f"{station_name} 5-Year Flood Return Period (culQ5)"
-        elif culq_type == SENSOR_CUL_Q50:
-            self._attr_name = f"{station_name} 50-Year Flood Return Period (culQ50)"
-        else:
-            self._attr_name = f"{station_name} {culq_type}"
+        # Set name and value key based on culQ type
+        name_suffix, self._culq_key = _CULQ_META.get(culq_type, (culq_type, None))
+        self._attr_name = f"{station_name} {name_suffix}"
 
         # Set device class and state class for culQ sensor
         self._attr_device_class = SensorDeviceClass.VOLUME_FLOW_RATE
@@ -286,38 +306,20 @@ class SildreCulQSensor(SildreBaseSensor):
         self._attr_native_unit_of_measurement = UnitOfVolumeFlowRate.CUBIC_METERS_PER_SECOND
         self._attr_icon = "mdi:chart-line"
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if not self.coordinator.data:
-            return None
-
-        station_data = self.coordinator.data
-        culq_data = station_data.get("culq_data", {})
-
-        # Return the appropriate culQ value based on sensor type
-        if self.culq_type == SENSOR_CUL_QM:
-            return culq_data.get("culQm")
-        elif self.culq_type == SENSOR_CUL_Q5:
-            return culq_data.get("culQ5")
-        elif self.culq_type == SENSOR_CUL_Q50:
-            return culq_data.get("culQ50")
-
-        return None
+        # culQ attributes never change for a station
+        self._attr_extra_state_attributes = {
+            ATTR_STATION_NAME: station_name,
+            ATTR_STATION_ID: station_id,
+            "culq_type": culq_type,
+        }
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        if not self.coordinator.data:
-            return {}
+        self._update_from_coordinator()
 
-        station_data = self.coordinator.data
-
-        attrs = {
-            ATTR_ATTRIBUTION: "Data provided by NVE Hydrological API",
-            ATTR_STATION_NAME: station_data.get("station_name", self.station_name),
-            ATTR_STATION_ID: self.station_id,
-            "culq_type": self.culq_type,
-        }
+    def _update_from_coordinator(self) -> None:
+        """Set state and attributes from the latest coordinator data."""
+        culq_data = self.coordinator.data
+        if not culq_data:
+            self._attr_native_value = None
+            return
 
-        return attrs
+        self._attr_native_value = culq_data.get(self._culq_key)